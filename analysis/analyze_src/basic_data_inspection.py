@@ -1,6 +1,22 @@
 from abc import ABC, abstractmethod
+from typing import Dict, Type, Union
 import pandas as pd
 import os
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import polars as pl
+    import polars.selectors as cs
+except ImportError:
+    pl = None
+
+# pandas' numba engine is only usable when numba is installed
+try:
+    from numba.core.errors import NumbaTypeSafetyWarning
+except ImportError:
+    NumbaTypeSafetyWarning = None
+NUMBA_AVAILABLE = NumbaTypeSafetyWarning is not None
 
 
 # Abstract Base Class for Data Inspection Strategies
@@ -36,14 +52,75 @@ class DataTypeInspectionStrategy(DataInspectionStrategy):
         None: Prints the data types and non-null counts to the console.
         """
 
-        print("\nData Types adn Non-null Counts:")
-        print(df.info())
+        # isna() on Arrow-backed columns only counts the validity bitmaps
+        nulls = df.isna().sum()
+
+        print("\nData Types and Non-null Counts:")
+        # to_string prints every row and column, like df.info() did
+        print(pd.DataFrame({"dtype": df.dtypes, "nulls": nulls, "non_null": len(df) - nulls}).to_string())
+
+
+def _describe_categorical_polars(df: "pl.DataFrame") -> "pl.DataFrame":
+    """
+    Computes count, unique, top and freq (the statistics of pandas' describe for
+    non-numeric columns) for every column of a polars dataframe. polars' own describe
+    only reports min/max for these columns, which is empty for Categorical columns.
+
+    Parameters:
+    df (pl.DataFrame): The non-numeric columns to be summarized.
+
+    Returns:
+    pl.DataFrame: One row per column with count, unique, top and freq.
+    """
+    # One select over all columns, so polars evaluates the statistics in parallel.
+    # Aliases are positional to avoid clashes with column names such as "count".
+    exprs = []
+    for i, name in enumerate(df.columns):
+        values = pl.col(name).drop_nulls().cast(pl.String)
+        # Ties between modes are broken by the smallest value, so top is deterministic
+        top = values.mode().sort().first()
+        exprs += [
+            values.len().alias(f"{i}_count"),
+            values.n_unique().alias(f"{i}_unique"),
+            top.alias(f"{i}_top"),
+            (values == top).sum().alias(f"{i}_freq"),
+        ]
+
+    stats = df.select(exprs).row(0) if exprs else ()
+    rows = [(name, *stats[4 * i:4 * i + 4]) for i, name in enumerate(df.columns)]
+    return pl.DataFrame(
+        rows,
+        schema={"column": pl.String, "count": pl.Int64, "unique": pl.Int64, "top": pl.String, "freq": pl.Int64},
+        orient="row",
+    )
 
 
 class SummaryStatisticsInspectionStrategy(DataInspectionStrategy):
+    def __init__(self, group_by: str = None, engine: str = None):
+        """
+        Initializes the strategy, optionally with a column to compute per-group statistics for.
+
+        Parameters:
+        group_by (str): The column whose groups get their own numerical summary. None disables it.
+        engine (str): Engine for the per-group aggregations: None (pandas' cython kernels) or "numba".
+            numba pays several seconds of JIT compilation on the first call, so it only pays off
+            for large dataframes or repeated calls.
+
+        Returns:
+        None
+        """
+        if engine not in (None, "cython", "numba"):
+            raise ValueError(f"Unsupported groupby engine: {engine}")
+        if engine == "numba" and not NUMBA_AVAILABLE:
+            raise ImportError('engine="numba" requires the numba package')
+        self.group_by = group_by
+        self.engine = engine
+
     def inspect(self, df: pd.DataFrame):
-         """
+        """
         Prints summary statistics for numerical and categorical features.
+        Uses polars (column statistics computed in parallel) when it is installed
+        and falls back to pandas otherwise.
 
         Parameters:
         df (pd.DataFrame): The dataframe to be inspected.
@@ -51,65 +128,250 @@ class SummaryStatisticsInspectionStrategy(DataInspectionStrategy):
         Returns:
         None: Prints summary statistics to the console.
         """
-         
-         print("\n\nSummary Statistics (Numerical Features)")
-         print(df.describe())
-         print("\n\nSummary Statistics (Categorical Features)")
-         print(df.describe(include=["O"]))
+
+        # Split the columns once and reuse the split for every summary below
+        num_cols = df.select_dtypes("number").columns
+        cat_cols = df.columns.difference(num_cols, sort=False)
+
+        if pl is not None:
+            # Zero-copy for Arrow-backed columns
+            pldf = pl.from_pandas(df)
+            num_summary = pldf.select(list(num_cols)).describe() if len(num_cols) else None
+            cat_summary = _describe_categorical_polars(pldf.select(list(cat_cols))) if len(cat_cols) else None
+        else:
+            # The two describes cover disjoint columns, so run them side by side
+            with ThreadPoolExecutor(max_workers=2) as ex:
+                num_future = ex.submit(df[num_cols].describe) if len(num_cols) else None
+                cat_future = ex.submit(df[cat_cols].describe) if len(cat_cols) else None
+            num_summary = num_future.result() if num_future is not None else None
+            cat_summary = cat_future.result() if cat_future is not None else None
+
+        print("\n\nSummary Statistics (Numerical Features)")
+        print(num_summary)
+        print("\n\nSummary Statistics (Categorical Features)")
+        print(cat_summary)
+
+        if self.group_by is not None:
+            print(f"\n\nSummary Statistics (Numerical Features by {self.group_by})")
+            print(self._describe_by_group(df, self.group_by, num_cols, self.engine))
+
+    @staticmethod
+    def _describe_by_group(df: pd.DataFrame, group_by: str, num_cols: pd.Index, engine: str = None) -> pd.DataFrame:
+        """
+        Computes mean, std, min and max of every numerical column per group.
+        With engine="numba" the aggregations run as parallel numba kernels;
+        the first call pays the JIT compilation, later calls hit the cache.
+        pandas' numba kernels crash on a group with no valid values in a column,
+        so the cython engine is used whenever such a group exists.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe to be summarized.
+        group_by (str): The column to group by.
+        num_cols (pd.Index): The numerical columns of df.
+        engine (str): None/"cython" for pandas' default kernels, or "numba".
+
+        Returns:
+        pd.DataFrame: One row per group, columns indexed by (statistic, feature).
+        """
+
+        # numba kernels need plain float64 numpy columns (nulls become NaN)
+        numeric = df[num_cols.drop(group_by, errors="ignore")].astype("float64")
+        grouped = numeric.groupby(df[group_by], sort=False)
+
+        use_numba = engine == "numba" and numeric.notna().groupby(df[group_by], sort=False).any().to_numpy().all()
+        if use_numba:
+            engine, engine_kwargs = "numba", {"parallel": True, "nopython": True}
+        else:
+            engine, engine_kwargs = None, None
+
+        with warnings.catch_warnings():
+            if use_numba:
+                # Raised by pandas' own kernels on every call; not actionable here
+                warnings.simplefilter("ignore", NumbaTypeSafetyWarning)
+            return pd.concat(
+                {stat: getattr(grouped, stat)(engine=engine, engine_kwargs=engine_kwargs) for stat in ("mean", "std", "min", "max")},
+                axis=1,
+            )
+
+
+# Registry of Data Inspection Strategies
+# --------------------------------------
+# Maps a strategy name to its strategy class, so inspectors can be configured by name.
+STRATEGIES: Dict[str, Type[DataInspectionStrategy]] = {
+    "dtype": DataTypeInspectionStrategy,
+    "summary": SummaryStatisticsInspectionStrategy,
+}
     
 
 # Context Class that uses a DataInspectionStrategy
 # ------------------------------------------------
 # This class allows you to switch between different data inspection strategies.
 class DataInspector:
-    def __init__(self, strategy : DataInspectionStrategy):
+    # Registry that string strategy keys are resolved against
+    registry = STRATEGIES
+
+    def __init__(self, strategy: Union[str, DataInspectionStrategy], **options):
         """
         Initializes the DataInspector with a specific inspection strategy.
 
         Parameters:
-        strategy (DataInspectionStrategy): The strategy to be used for data inspection.
+        strategy (str | DataInspectionStrategy): A key of STRATEGIES or the strategy to be used for data inspection.
+        **options: Constructor arguments for the strategy when it is given by key (e.g. group_by).
 
         Returns:
         None
         """
-        self.strategy = strategy
+        # Strategies run by key through execute_strategy(key=...), created once per key
+        self._registered = {}
+        self.set_strategy(strategy, **options)
 
-    def set_strategy(self, strategy: DataInspectionStrategy):
+    def set_strategy(self, strategy: Union[str, DataInspectionStrategy], **options):
         """
         Sets a new strategy for the DataInspector.
+        The inspect callable is resolved here once, not on every execution.
 
         Parameters:
-        strategy (DataInspectionStrategy): The new strategy to be used for data inspection.
+        strategy (str | DataInspectionStrategy): A key of STRATEGIES or the new strategy to be used for data inspection.
+        **options: Constructor arguments for the strategy when it is given by key (e.g. group_by).
 
-        Returns:df
+        Returns:
         None
         """
 
+        if isinstance(strategy, str):
+            strategy = self.registry[strategy](**options)
         self.strategy = strategy
+        self._inspect = strategy.inspect
 
-    def execute_strategy(self, df: pd.DataFrame):
+    def execute_strategy(self, df: pd.DataFrame, key: str = None):
         """
-        Executes the inspection using the current strategy.
+        Executes the inspection using the current strategy, or the registered strategy named by key.
 
         Parameters:
         df (pd.DataFrame): The dataframe to be inspected.
+        key (str): Optional key of STRATEGIES to run, with default options, instead of the current strategy.
 
         Returns:
         None: Executes the strategy's inspection method.
         """
 
-        self.strategy.inspect(df)
+        inspect = self._inspect if key is None else self._registered_inspect(key)
+        inspect(df)
+
+    def _registered_inspect(self, key: str):
+        """
+        Returns the inspect method of the registered strategy named key.
+        The strategy is created with default options on first use and reused afterwards.
+
+        Parameters:
+        key (str): A key of the registry.
+
+        Returns:
+        Callable: The strategy's inspect method.
+        """
+
+        inspect = self._registered.get(key)
+        if inspect is None:
+            inspect = self._registered[key] = self.registry[key]().inspect
+        return inspect
+
+
+# Concrete Strategy for Data Types Inspection on polars dataframes
+# -----------------------------------------------------------------
+# This strategy prints the schema of a polars dataframe together with its null counts.
+class PolarsDataTypeInspectionStrategy(DataInspectionStrategy):
+    def inspect(self, df: "pl.DataFrame"):
+        """
+        Inspects and prints the data types and non-null counts of the polars dataframe columns.
+
+        Parameters:
+        df (pl.DataFrame): The dataframe to be inspected.
+
+        Returns:
+        None: Prints the data types and non-null counts to the console.
+        """
+
+        nulls = list(df.null_count().row(0))
+
+        print("\nData Types and Non-null Counts:")
+        # Show every row and the full dtype strings instead of polars' truncated preview
+        with pl.Config(tbl_rows=-1, tbl_cols=-1, fmt_str_lengths=100):
+            print(pl.DataFrame({
+                "column": df.columns,
+                "dtype": [str(dtype) for dtype in df.dtypes],
+                "nulls": nulls,
+                "non_null": [df.height - n for n in nulls],
+            }))
+
+
+# Concrete Strategy for Summary Statistics on polars dataframes
+# --------------------------------------------------------------
+# This strategy runs polars' describe, which computes the column statistics in parallel,
+# and reports count/unique/top/freq for the non-numeric columns.
+class PolarsSummaryStatisticsInspectionStrategy(DataInspectionStrategy):
+    def inspect(self, df: "pl.DataFrame"):
+        """
+        Prints summary statistics for numerical and categorical features of a polars dataframe.
+
+        Parameters:
+        df (pl.DataFrame): The dataframe to be inspected.
+
+        Returns:
+        None: Prints summary statistics to the console.
+        """
+
+        num_df = df.select(cs.numeric())
+        cat_df = df.select(~cs.numeric())
+
+        print("\n\nSummary Statistics (Numerical Features)")
+        print(num_df.describe() if num_df.width else None)
+        print("\n\nSummary Statistics (Categorical Features)")
+        print(_describe_categorical_polars(cat_df) if cat_df.width else None)
+
+
+# Registry of polars Data Inspection Strategies
+# ---------------------------------------------
+POLARS_STRATEGIES: Dict[str, Type[DataInspectionStrategy]] = {
+    "dtype": PolarsDataTypeInspectionStrategy,
+    "summary": PolarsSummaryStatisticsInspectionStrategy,
+}
+
+
+# Context Class for polars dataframes
+# -----------------------------------
+# This inspector resolves strategy keys against POLARS_STRATEGIES, so the same keys
+# ("dtype", "summary") work on dataframes returned by the polars ingest backend.
+class PolarsDataInspector(DataInspector):
+    registry = POLARS_STRATEGIES
+
+    def __init__(self, strategy: Union[str, DataInspectionStrategy], **options):
+        """
+        Initializes the PolarsDataInspector with a specific inspection strategy.
+
+        Parameters:
+        strategy (str | DataInspectionStrategy): A key of POLARS_STRATEGIES or the strategy to be used for data inspection.
+        **options: Constructor arguments for the strategy when it is given by key.
+
+        Returns:
+        None
+        """
+        if pl is None:
+            raise ImportError("PolarsDataInspector requires the polars package")
+        super().__init__(strategy, **options)
 
 
 if __name__ == "__main__":
         
     #Load the data
-    df = pd.read_csv("extracted_data\AmesHousing.csv")
+    if int(pd.__version__.split(".")[0]) >= 2:
+        df = pd.read_csv("extracted_data/AmesHousing.csv", engine="pyarrow", dtype_backend="pyarrow")
+    else:
+        df = pd.read_csv("extracted_data/AmesHousing.csv")
 
     #Initialize the inspector with the inspection strategy
-    inspector = DataInspector(DataTypeInspectionStrategy())
+    inspector = DataInspector("dtype")
     inspector.execute_strategy(df)
 
     #change the strategy to summary statistics and execute
-    inspector.set_strategy(SummaryStatisticsInspectionStrategy())
+    inspector.set_strategy("summary")
     inspector.execute_strategy(df)
\ No newline at end of file
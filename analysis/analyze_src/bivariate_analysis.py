@@ -1,16 +1,63 @@
 from abc import ABC, abstractmethod
-import seaborn as sns
+from typing import Dict, Type, Union
 import pandas as pd
 import matplotlib.pyplot as plt
 
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+# Figure and Axes that callers can opt into sharing, so repeated calls reuse one canvas and renderer
+_FIG, _AX = None, None
+
+
+def shared_axes():
+    """
+    Returns the shared Axes, cleared for a new plot. The Figure is only
+    (re)created on first use or after its window has been closed.
+    Pass it as ax= when plotting in a loop; each call overwrites the previous plot,
+    so do not keep the returned Figure across calls.
+
+    Returns:
+    matplotlib.axes.Axes: The Axes to draw on.
+    """
+    global _FIG, _AX
+    if _FIG is None or not plt.fignum_exists(_FIG.number):
+        _FIG, _AX = plt.subplots(figsize=(10,6))
+    elif len(_FIG.axes) > 1:
+        # The previous plot added a colorbar; start again from an empty figure
+        _FIG.clear()
+        _AX = _FIG.add_subplot()
+    else:
+        _AX.clear()
+    return _AX
+
+
+def _as_pandas(df, columns: list) -> pd.DataFrame:
+    """
+    Returns the given columns as a pandas dataframe. polars dataframes are converted
+    to Arrow-backed pandas columns (zero-copy); pandas dataframes are returned unchanged.
+
+    Parameters:
+    df (pd.DataFrame | pl.DataFrame): The dataframe containing the data.
+    columns (list): The columns needed by the analysis.
+
+    Returns:
+    pd.DataFrame: A pandas dataframe containing at least the requested columns.
+    """
+    if pl is not None and isinstance(df, pl.DataFrame):
+        return df.select(columns).to_pandas(use_pyarrow_extension_array=True)
+    return df
+
 
 # Abstract Base Class for Bivariate Analysis Strategy
-# ----------------------------------------------------
+# ---------------------------------------------------
 # This class defines a common interface for bivariate analysis strategies.
 # Subclasses must implement the analyze method.
 class BivariateAnalysisStrategy(ABC):
     @abstractmethod
-    def analyze(self, df: pd.DataFrame, feature1: str, feature2: str):
+    def analyze(self, df: pd.DataFrame, feature1: str, feature2: str, ax=None):
         """
         Perform bivariate analysis on two features of the dataframe.
 
@@ -18,9 +65,10 @@ class BivariateAnalysisStrategy(ABC):
         df (pd.DataFrame): The dataframe containing the data.
         feature1 (str): The name of the first feature/column to be analyzed.
         feature2 (str): The name of the second feature/column to be analyzed.
+        ax (matplotlib.axes.Axes): The Axes to draw on. Defaults to a new figure; pass shared_axes() to reuse one.
 
         Returns:
-        None: This method visualizes the relationship between the two features.
+        matplotlib.figure.Figure: The figure containing the plot. It is not shown; call plt.show() or AnalysisRunner.render_all().
         """
         pass
 
@@ -30,25 +78,58 @@ class BivariateAnalysisStrategy(ABC):
 # This strategy analyzes the relationship between two numerical features using scatter plots.
 class NumericalVsNumericalAnalysis(BivariateAnalysisStrategy):
 
-    def analyze(self, df: pd.DataFrame, feature1: str, feature2: str):
+    def __init__(self, max_points: int = 50_000, hexbin_threshold: int = 200_000):
+        """
+        Initializes the strategy with limits that keep rendering cost bounded on large dataframes.
+
+        Parameters:
+        max_points (int): Maximum number of points drawn; larger dataframes are randomly sampled down to this size.
+        hexbin_threshold (int): Row count above which a hexbin density plot is drawn instead of a scatter plot.
+
+        Returns:
+        None
+        """
+        self.max_points = max_points
+        self.hexbin_threshold = hexbin_threshold
+
+    def analyze(self, df: pd.DataFrame, feature1: str, feature2: str, ax=None):
         """
         Plots the relationship between two numerical features using a scatter plot.
+        Very large dataframes are drawn as a hexbin plot instead.
 
         Parameters:
         df (pd.DataFrame): The dataframe containing the data.
         feature1 (str): The name of the first numerical feature/column to be analyzed.
         feature2 (str): The name of the second numerical feature/column to be analyzed.
+        ax (matplotlib.axes.Axes): The Axes to draw on. Defaults to a new figure; pass shared_axes() to reuse one.
 
         Returns:
-        None: Displays a scatter plot showing the relationship between the two features.
+        matplotlib.figure.Figure: The figure containing the scatter plot.
         """
 
-        plt.figure(figsize=(10,6))
-        sns.scatterplot(x=feature1, y=feature2, data=df)
-        plt.title(f"{feature1} vs {feature2}")
-        plt.xlabel(f"{feature1}")
-        plt.ylabel(f"{feature2}")
-        plt.show()
+        df = _as_pandas(df, [feature1, feature2])
+        n = len(df)
+
+        if ax is None:
+            _, ax = plt.subplots(figsize=(10,6))
+        if n > self.hexbin_threshold:
+            # Binning is O(grid) to draw, so use every row
+            xy = df[[feature1, feature2]].dropna().astype("float64")
+            hb = ax.hexbin(xy[feature1], xy[feature2], gridsize=80, mincnt=1)
+            ax.figure.colorbar(hb, ax=ax, label="Count")
+        else:
+            xy = df[[feature1, feature2]]
+            sub = xy.sample(n=self.max_points, random_state=0) if n > self.max_points else xy
+            # A bare marker line skips seaborn's per-point hue/size handling
+            ax.plot(
+                sub[feature1].to_numpy(dtype="float64", na_value=float("nan")),
+                sub[feature2].to_numpy(dtype="float64", na_value=float("nan")),
+                ".", markersize=3, alpha=0.5, rasterized=True,
+            )
+        ax.set_title(f"{feature1} vs {feature2}")
+        ax.set_xlabel(f"{feature1}")
+        ax.set_ylabel(f"{feature2}")
+        return ax.figure
 
 
 # Concrete Strategy for Categorical vs Numerical Analysis
@@ -56,7 +137,7 @@ class NumericalVsNumericalAnalysis(BivariateAnalysisStrategy):
 # This strategy analyzes the relationship between a categorical feature and a numerical feature using box plots.
 class CategoricalVsNumericalStrategyAnalysis(BivariateAnalysisStrategy):
 
-    def analyze(self, df: pd.DataFrame, feature1: str, feature2: str):
+    def analyze(self, df: pd.DataFrame, feature1: str, feature2: str, ax=None):
         """
         Plots the relationship between a categorical feature and a numerical feature using a box plot.
 
@@ -64,73 +145,223 @@ class CategoricalVsNumericalStrategyAnalysis(BivariateAnalysisStrategy):
         df (pd.DataFrame): The dataframe containing the data.
         feature1 (str): The name of the categorical feature/column to be analyzed.
         feature2 (str): The name of the numerical feature/column to be analyzed.
+        ax (matplotlib.axes.Axes): The Axes to draw on. Defaults to a new figure; pass shared_axes() to reuse one.
+
+        Returns:
+        matplotlib.figure.Figure: The figure containing the box plot.
+        """
+
+        df = _as_pandas(df, [feature1, feature2])
+        if ax is None:
+            _, ax = plt.subplots(figsize=(10,6))
+        ax.bxp(self._box_stats(df, feature1, feature2))
+        ax.set_title(f"{feature1} vs {feature2}")
+        ax.set_xlabel(f"{feature1}")
+        ax.set_ylabel(f"{feature2}")
+        ax.tick_params(axis="x", labelrotation=45)
+        return ax.figure
+
+    @staticmethod
+    def _box_stats(df: pd.DataFrame, feature1: str, feature2: str) -> list:
+        """
+        Computes the per-category box plot statistics with vectorized groupby operations,
+        so only one box per category is handed to matplotlib.
+
+        Parameters:
+        df (pd.DataFrame): The dataframe containing the data.
+        feature1 (str): The name of the categorical feature/column to group by.
+        feature2 (str): The name of the numerical feature/column to summarize.
 
         Returns:
-        None: Displays a box plot showing the relationship between the categorical and numerical features.
+        list: One dict per category in the format expected by Axes.bxp.
         """
 
-        plt.figure(figsize=(10,6))
-        sns.scatterplot(x=feature1, y=feature2, data=df)
-        plt.title(f"{feature1} vs {feature2}")
-        plt.xlabel(f"{feature1}")
-        plt.ylabel(f"{feature2}")
-        plt.xticks(rotation=45)
-        plt.show()
+        data = df[[feature1, feature2]].dropna()
+        if data.empty:
+            # Nothing to summarize; draw an empty plot like seaborn would
+            return []
+
+        keys = data[feature1]
+        values = data[feature2].astype("float64")
+
+        quartiles = values.groupby(keys, observed=True, sort=True).quantile([0.25, 0.5, 0.75]).unstack()
+        quartiles.columns = ["q1", "med", "q3"]
+        iqr = quartiles["q3"] - quartiles["q1"]
+
+        # Whiskers reach the most extreme values within 1.5 IQR of the box (matplotlib's default)
+        lo_fence = (quartiles["q1"] - 1.5 * iqr).reindex(keys).to_numpy()
+        hi_fence = (quartiles["q3"] + 1.5 * iqr).reindex(keys).to_numpy()
+        inside = (values.to_numpy() >= lo_fence) & (values.to_numpy() <= hi_fence)
+        whiskers = values[inside].groupby(keys[inside], observed=True).agg(["min", "max"])
+        fliers = {key: group.to_numpy() for key, group in values[~inside].groupby(keys[~inside], observed=True)}
+
+        return [
+            {
+                "label": str(key),
+                "q1": row["q1"],
+                "med": row["med"],
+                "q3": row["q3"],
+                "whislo": whiskers.at[key, "min"],
+                "whishi": whiskers.at[key, "max"],
+                "fliers": fliers.get(key, []),
+            }
+            for key, row in quartiles.iterrows()
+        ]
+
+
+# Registry of Bivariate Analysis Strategies
+# -----------------------------------------
+# Maps a strategy name to its strategy class, so analyzers can be configured by name.
+STRATEGIES: Dict[str, Type[BivariateAnalysisStrategy]] = {
+    "numerical": NumericalVsNumericalAnalysis,
+    "categorical": CategoricalVsNumericalStrategyAnalysis,
+}
 
 
 # Context Class that uses a BivariateAnalysisStrategy
 # ---------------------------------------------------
 # This class allows you to switch between different bivariate analysis strategies.
 class BivariateAnalyzer:
-    def __init__(self, strategy: BivariateAnalysisStrategy):
+    # Registry that string strategy keys are resolved against
+    registry = STRATEGIES
+
+    def __init__(self, strategy: Union[str, BivariateAnalysisStrategy], **options):
         """
         Initializes the BivariateAnalyzer with a specific analysis strategy.
 
         Parameters:
-        strategy (BivariateAnalysisStrategy): The strategy to be used for bivariate analysis.
+        strategy (str | BivariateAnalysisStrategy): A key of STRATEGIES or the strategy to be used for bivariate analysis.
+        **options: Constructor arguments for the strategy when it is given by key (e.g. max_points).
 
         Returns:
         None
         """
-        self.strategy = strategy
+        # Strategies run by key through execute_analysis(key=...), created once per key
+        self._registered = {}
+        self.set_strategy(strategy, **options)
 
-    def set_strategy(self, strategy: BivariateAnalysisStrategy):
+    def set_strategy(self, strategy: Union[str, BivariateAnalysisStrategy], **options):
         """
         Sets a new strategy for the BivariateAnalyzer.
+        The analyze callable is resolved here once, not on every execution.
 
         Parameters:
-        strategy (BivariateAnalysisStrategy): The new strategy to be used for bivariate analysis.
+        strategy (str | BivariateAnalysisStrategy): A key of STRATEGIES or the new strategy to be used for bivariate analysis.
+        **options: Constructor arguments for the strategy when it is given by key (e.g. max_points).
 
         Returns:
         None
         """
 
-        self.strategy= strategy
+        if isinstance(strategy, str):
+            strategy = self.registry[strategy](**options)
+        self.strategy = strategy
+        self._analyze = strategy.analyze
 
-    def execute_analysis(self, df: pd.DataFrame, feature1: str, feature2: str):
+    def execute_analysis(self, df: pd.DataFrame, feature1: str, feature2: str, ax=None, key: str = None):
         """
-        Executes the bivariate analysis using the current strategy.
+        Executes the bivariate analysis using the current strategy, or the registered strategy named by key.
 
         Parameters:
         df (pd.DataFrame): The dataframe containing the data.
         feature1 (str): The name of the first feature/column to be analyzed.
         feature2 (str): The name of the second feature/column to be analyzed.
+        ax (matplotlib.axes.Axes): The Axes to draw on. Defaults to a new figure; pass shared_axes() to reuse one.
+        key (str): Optional key of STRATEGIES to run, with default options, instead of the current strategy.
 
         Returns:
-        None: Executes the strategy's analysis method and visualizes the results.
+        matplotlib.figure.Figure: The figure produced by the strategy's analysis method.
         """
 
-        self.strategy.analyze(df, feature1, feature2)
+        analyze = self._analyze if key is None else self._registered_analyze(key)
+        return analyze(df, feature1, feature2, ax=ax)
+
+    def _registered_analyze(self, key: str):
+        """
+        Returns the analyze method of the registered strategy named key.
+        The strategy is created with default options on first use and reused afterwards.
+
+        Parameters:
+        key (str): A key of the registry.
+
+        Returns:
+        Callable: The strategy's analyze method.
+        """
+
+        analyze = self._registered.get(key)
+        if analyze is None:
+            analyze = self._registered[key] = self.registry[key]().analyze
+        return analyze
+
+
+# Runner that batches several bivariate analyses
+# ----------------------------------------------
+# This class queues analyses and renders them all in one figure with a single plt.show() call,
+# instead of blocking on a separate window after every analysis.
+class AnalysisRunner:
+    def __init__(self):
+        """
+        Initializes the AnalysisRunner with an empty queue.
+
+        Returns:
+        None
+        """
+        self.jobs = []
+
+    def add(self, strategy: Union[str, BivariateAnalysisStrategy], df: pd.DataFrame, feature1: str, feature2: str, **options):
+        """
+        Queues an analysis to be drawn by the next render_all call.
+
+        Parameters:
+        strategy (str | BivariateAnalysisStrategy): A key of STRATEGIES or the strategy to be used for the analysis.
+        df (pd.DataFrame): The dataframe containing the data.
+        feature1 (str): The name of the first feature/column to be analyzed.
+        feature2 (str): The name of the second feature/column to be analyzed.
+        **options: Constructor arguments for the strategy when it is given by key (e.g. max_points).
+
+        Returns:
+        None
+        """
+        self.jobs.append((BivariateAnalyzer(strategy, **options), df, feature1, feature2))
+
+    def render_all(self, block: bool = True):
+        """
+        Draws every queued analysis into its own row of one figure, then shows it once.
+
+        Parameters:
+        block (bool): Whether plt.show() blocks until the window is closed.
+
+        Returns:
+        matplotlib.figure.Figure: The figure containing all queued plots, or None if the queue was empty.
+        """
+
+        if not self.jobs:
+            return None
+
+        fig, axes = plt.subplots(len(self.jobs), 1, figsize=(10, 6 * len(self.jobs)), squeeze=False)
+        for (analyzer, df, feature1, feature2), ax in zip(self.jobs, axes[:, 0]):
+            analyzer.execute_analysis(df, feature1, feature2, ax=ax)
+        self.jobs.clear()
+
+        fig.tight_layout()
+        plt.show(block=block)
+        return fig
 
 
 if __name__ == "__main__":
    #Load the data
-   df = pd.read_csv("extracted_data/AmesHousing.csv")
+   if int(pd.__version__.split(".")[0]) >= 2:
+       df = pd.read_csv("extracted_data/AmesHousing.csv", engine="pyarrow", dtype_backend="pyarrow")
+   else:
+       df = pd.read_csv("extracted_data/AmesHousing.csv")
+
+   runner = AnalysisRunner()
 
    #Analyzing Num vs Num features
-   analyzer = BivariateAnalyzer(NumericalVsNumericalAnalysis())
-   analyzer.execute_analysis(df, 'Gr Liv Area', 'SalePrice')
+   runner.add("numerical", df, 'Gr Liv Area', 'SalePrice')
 
    #Analyzing Cat vs Num features
-   analyzer.set_strategy(CategoricalVsNumericalStrategyAnalysis())
-   analyzer.execute_analysis(df, 'Overall Qual', 'SalePrice')
\ No newline at end of file
+   runner.add("categorical", df, 'Overall Qual', 'SalePrice')
+
+   #Render both plots with a single show
+   runner.render_all()
\ No newline at end of file
@@ -1,7 +1,36 @@
+import hashlib
 import os
+import tempfile
 import zipfile
+import zlib
 from abc import ABC, abstractmethod
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.feather as feather
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+#strings parsed as missing values, same as the pandas.read_csv defaults
+NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+]
+
+#bump whenever parsing changes so Feather caches written by older versions are rebuilt
+CACHE_VERSION = 2
+
+
+def _arrow_dtype_mapper(arrow_type: pa.DataType):
+    """Maps Arrow types to pd.ArrowDtype, except dictionary types, which fall back to pandas Categorical"""
+
+    if pa.types.is_dictionary(arrow_type):
+        return None
+    return pd.ArrowDtype(arrow_type)
 
 
 #Define an abstract class for DataIngestor
@@ -14,42 +43,174 @@ class DataIngestor(ABC):
 
 #Implement concrete class for zip ingestion
 class ZipDataIngestor(DataIngestor):
-    def ingest(self, file_path:str) -> pd.DataFrame:
-        """Extracts a .zip file and returns a pandas dataframe"""
+    def __init__(self, backend: str = "pandas"):
+        """Creates the ingestor; backend selects the returned dataframe type ("pandas" or "polars")"""
+
+        if backend not in ("pandas", "polars"):
+            raise ValueError(f"Unsupported dataframe backend: {backend}")
+        if backend == "polars" and pl is None:
+            raise ImportError("The polars backend requires the polars package")
+        self.backend = backend
+
+    def ingest(self, file_path:str, extract_dir: str = None) -> pd.DataFrame:
+        """Reads the CSV inside a .zip file straight from the archive and returns a dataframe
+        (pandas by default, polars if the ingestor was created with backend="polars").
+        If extract_dir is given, a copy of the CSV is also extracted there."""
 
         #ensure file is a .zip
         if not file_path.endswith(".zip"):
             raise ValueError("The provided file is not a .zip file")
-        
-        #extract the zip file
+
         with zipfile.ZipFile(file_path, "r") as zip_ref:
-            zip_ref.extractall("D:\ML Projects\House Price Prediction\extracted_data")
+            #find the csv file in the archive (assuming there is only one csv file in the .zip file)
+            csv_files = [f for f in zip_ref.namelist() if f.endswith(".csv")]
 
-        #find the extracted csv file (assuming there is only one csv file in the .zip file)
-        extracted_files = os.listdir("extracted_data")
-        csv_files = [f for f in extracted_files if f.endswith(".csv")]
+            if len(csv_files) == 0:
+                raise FileNotFoundError("No CSV file found in the .zip file")
+            if len(csv_files) > 1:
+                raise ValueError("Multiple CSV files found. Specify which one to use")
 
-        if len(csv_files) == 0:
-            raise FileNotFoundError("No CSV file found in extracted_data")
-        if len(csv_files) > 1:
-            raise ValueError("Multiple CSV files found. Specify which one to use")
-        
-        #read the CSV into a dataframe
-        csv_file_path = os.path.join("D:\ML Projects\House Price Prediction\extracted_data", csv_files[0])
-        df = pd.read_csv(csv_file_path)
+            #keep the cache next to the extracted copy, or next to the archive when nothing is extracted
+            cache_dir = extract_dir if extract_dir is not None else os.path.dirname(file_path)
+            #key the cache on the absolute archive path so different archives never share a cache file
+            archive_path = os.path.abspath(file_path)
+            archive_stem = os.path.splitext(os.path.basename(file_path))[0]
+            csv_stem = os.path.splitext(os.path.basename(csv_files[0]))[0]
+            path_hash = hashlib.sha1(archive_path.encode("utf-8")).hexdigest()[:8]
+            cache_name = f"{archive_stem}_{csv_stem}_{path_hash}.v{CACHE_VERSION}.feather"
+            cache_path = os.path.join(cache_dir, cache_name)
+            source_metadata = self._source_metadata(archive_path)
+
+            #reuse the Feather cache if it was built from this exact archive (path, size and mtime)
+            cached = self._read_cache(cache_path, source_metadata)
+            if cached is not None:
+                #still honour extract_dir if the extracted copy is missing or does not match the archive member
+                if extract_dir is not None and not self._is_extracted_copy_current(extract_dir, zip_ref.getinfo(csv_files[0])):
+                    zip_ref.extract(csv_files[0], extract_dir)
+                return self._to_dataframe(cached)
+
+            read_options = pacsv.ReadOptions(use_threads=True, block_size=8 << 20)
+            #treat "NA" etc. as missing in string columns too, not only empty cells
+            convert_options = pacsv.ConvertOptions(null_values=NA_VALUES, strings_can_be_null=True)
+
+            if extract_dir is not None:
+                #keep a copy of the CSV on disk and parse it through a memory map (no user-space copy of the file)
+                csv_file_path = zip_ref.extract(csv_files[0], extract_dir)
+                with pa.memory_map(csv_file_path, "r") as source:
+                    table = pacsv.read_csv(source, read_options=read_options, convert_options=convert_options)
+            else:
+                #stream the CSV member through the multi-threaded Arrow parser without extracting it
+                with zip_ref.open(csv_files[0]) as fh:
+                    table = pacsv.read_csv(fh, read_options=read_options, convert_options=convert_options)
+
+        #store low-cardinality string columns as dictionary (categorical) arrays
+        table = self._dictionary_encode_strings(table)
+
+        #cache the parsed table so later runs skip CSV parsing (best effort, e.g. the directory may be read-only)
+        self._write_cache(table.replace_schema_metadata(source_metadata), cache_path)
 
         #return the dataframe
-        return df
+        return self._to_dataframe(table)
+
+    def _to_dataframe(self, table: pa.Table):
+        """Converts the Arrow table into the configured dataframe type without copying column data where possible"""
+
+        if self.backend == "polars":
+            return pl.from_arrow(table)
+
+        #Arrow-backed pandas columns (no python object strings, nulls kept as bitmaps);
+        #dictionary columns become pandas Categorical, which sorting, .str and get_dummies support
+        return table.to_pandas(types_mapper=_arrow_dtype_mapper, self_destruct=True, split_blocks=True)
+
+    @staticmethod
+    def _dictionary_encode_strings(table: pa.Table, max_unique_ratio: float = 0.5) -> pa.Table:
+        """Dictionary-encodes string columns whose share of distinct values is below max_unique_ratio"""
+
+        if table.num_rows == 0:
+            return table
+
+        for i, field in enumerate(table.schema):
+            if not (pa.types.is_string(field.type) or pa.types.is_large_string(field.type)):
+                continue
+
+            column = table.column(i)
+            if pc.count_distinct(column).as_py() / table.num_rows < max_unique_ratio:
+                #combine chunks first so the column has a single dictionary (required by the Feather file format)
+                table = table.set_column(i, field.name, column.combine_chunks().dictionary_encode())
+
+        return table
+
+    @staticmethod
+    def _source_metadata(archive_path: str) -> dict:
+        """Returns the archive path, size and mtime that identify the data a cache was built from"""
+
+        stat = os.stat(archive_path)
+        return {
+            "source_path": archive_path,
+            "source_size": str(stat.st_size),
+            "source_mtime_ns": str(stat.st_mtime_ns),
+        }
+
+    @staticmethod
+    def _read_cache(cache_path: str, source_metadata: dict):
+        """Returns the cached table if its schema metadata matches the given source, otherwise None.
+        Unreadable cache files (e.g. truncated by an interrupted run) are treated as a cache miss."""
+
+        if not os.path.exists(cache_path):
+            return None
+
+        try:
+            #check the schema metadata before reading any column data
+            with pa.memory_map(cache_path, "r") as source:
+                metadata = pa.ipc.open_file(source).schema.metadata or {}
+            if any(metadata.get(key.encode()) != value.encode() for key, value in source_metadata.items()):
+                return None
+            return feather.read_table(cache_path, memory_map=True)
+        except (OSError, pa.ArrowInvalid):
+            return None
+
+    @staticmethod
+    def _write_cache(table: pa.Table, cache_path: str):
+        """Writes the cache through a temporary file in the same directory and moves it into place,
+        so an interrupted or failed write never leaves a partial cache file behind"""
+
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(cache_path) or ".", suffix=".tmp")
+            os.close(fd)
+            feather.write_feather(table, tmp_path, compression="zstd")
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            #caching is optional; clean up and return the parsed data anyway
+            if tmp_path is not None and os.path.exists(tmp_path):
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+    @staticmethod
+    def _is_extracted_copy_current(extract_dir: str, info: zipfile.ZipInfo) -> bool:
+        """Returns True if the extracted copy of the archive member exists with the same size and CRC-32"""
+
+        path = os.path.join(extract_dir, info.filename)
+        if not os.path.exists(path) or os.path.getsize(path) != info.file_size:
+            return False
+
+        crc = 0
+        with open(path, "rb") as fh:
+            for chunk in iter(lambda: fh.read(1 << 20), b""):
+                crc = zlib.crc32(chunk, crc)
+        return crc == info.CRC
     
 
 #Implement a Factory to create DataIngestors
 class DataIngestorFactory:
     @staticmethod
-    def get_data_ingestor(file_extension: str) -> DataIngestor:
+    def get_data_ingestor(file_extension: str, backend: str = "pandas") -> DataIngestor:
         """Returns the appropriate data ingestor based on the file extension"""
 
         if file_extension == ".zip":
-            return ZipDataIngestor()
+            return ZipDataIngestor(backend=backend)
         else:
             raise ValueError(f"No ingestor available for file extension: {file_extension}")
         
@@ -57,7 +218,7 @@ class DataIngestorFactory:
 if __name__ == "__main__":
     
     #specify file path
-    file_path =  "D:\ML Projects\House Price Prediction\data/archive.zip"
+    file_path = "data/archive.zip"
 
     #determine file extension
     file_ext = os.path.splitext(file_path)[1]